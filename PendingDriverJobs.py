@@ -1,41 +1,278 @@
+import io
+import posixpath
+import queue
+import threading
 import time
+import zipfile
 from tkinter import Tk, messagebox
+from xml.etree import ElementTree as ET
 
-from openpyxl import load_workbook
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:  # fall back to streaming the sheet XML ourselves
+    CalamineWorkbook = None
 
 
-def is_blank(value) -> bool:
-    if value is None:
-        return True
-    if isinstance(value, str) and value.strip() == "":
+NS_MAIN = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+NS_DOC_REL = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+
+ROW_TAG = f"{NS_MAIN}row"
+V_TAG = f"{NS_MAIN}v"
+T_TAG = f"{NS_MAIN}t"
+SI_TAG = f"{NS_MAIN}si"
+R_TAG = f"{NS_MAIN}r"
+SHEET_TAG = f"{NS_MAIN}sheet"
+
+DIGITS = "0123456789"
+
+DRIVER_PIPELINE = "driver pipeline"
+
+# 1-indexed column numbers: O=15, R=18, AA=27
+COL_O = 15   # Contractor Assigned
+COL_R = 18   # Invoice Number
+COL_AA = 27  # Print Date
+
+# Contractor names repeat on almost every row, so each distinct value is
+# normalised once and the answer remembered instead of strip/lower per row.
+CONTRACTOR_MATCHES: dict = {}
+
+
+def is_driver_pipeline(value) -> bool:
+    matched = CONTRACTOR_MATCHES.get(value)
+    if matched is None:
+        matched = isinstance(value, str) and value.strip().lower() == DRIVER_PIPELINE
+        CONTRACTOR_MATCHES[value] = matched
+    return matched
+
+
+def column_letter(index: int) -> str:
+    """Convert a 1-indexed column number to its Excel letter (1 -> A, 27 -> AA)."""
+    letters = ""
+    while index > 0:
+        index, rem = divmod(index - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
+
+
+def sheet_paths(zf: zipfile.ZipFile) -> dict[str, str]:
+    """Map each sheet name to its worksheet XML part inside the .xlsx package."""
+    workbook = ET.fromstring(zf.read("xl/workbook.xml"))
+    rels = ET.fromstring(zf.read("xl/_rels/workbook.xml.rels"))
+    targets = {rel.get("Id"): rel.get("Target", "") for rel in rels}
+
+    paths: dict[str, str] = {}
+    for sheet in workbook.iter(SHEET_TAG):
+        target = targets.get(sheet.get(f"{NS_DOC_REL}id"))
+        if not target:
+            continue
+        if target.startswith("/"):
+            paths[sheet.get("name")] = target.lstrip("/")
+        else:
+            paths[sheet.get("name")] = posixpath.normpath(posixpath.join("xl", target))
+    return paths
+
+
+def load_shared_strings(zf: zipfile.ZipFile) -> list[str]:
+    """Read the shared-strings table once so cells with t="s" can be resolved by index."""
+    try:
+        stream = zf.open("xl/sharedStrings.xml")
+    except KeyError:
+        return []
+
+    strings: list[str] = []
+    with stream:
+        for _, elem in ET.iterparse(stream, events=("end",)):
+            if elem.tag != SI_TAG:
+                continue
+            text = elem.findtext(T_TAG)
+            if text is None:
+                # Rich text: the string is split across <r><t> runs.
+                text = "".join(t.text or "" for t in elem.iterfind(f"{R_TAG}/{T_TAG}"))
+            strings.append(text)
+            elem.clear()
+    return strings
+
+
+def cell_value(cell: ET.Element, shared_strings: list[str]):
+    """Return a cell's value as text (or None when the cell has no value)."""
+    cell_type = cell.get("t")
+    if cell_type == "inlineStr":
+        return "".join(t.text or "" for t in cell.iter(T_TAG))
+    raw = cell.findtext(V_TAG)
+    if raw is None:
+        return None
+    if cell_type == "s":
+        return shared_strings[int(raw)]
+    # Numbers and dates stay as their raw text; we only test for presence.
+    return raw
+
+
+class PrefetchReader(io.RawIOBase):
+    """
+    Read a stream on a background thread so inflating the zip entry
+    overlaps with parsing it. zlib releases the GIL while it decompresses.
+    """
+
+    def __init__(self, stream, chunk_size: int = 1 << 20, depth: int = 4) -> None:
+        super().__init__()
+        self._chunks: queue.Queue[bytes] = queue.Queue(maxsize=depth)
+        self._chunk = memoryview(b"")
+        self._offset = 0
+        self._finished = False
+        self._error: Exception | None = None
+        worker = threading.Thread(target=self._fill, args=(stream, chunk_size), daemon=True)
+        worker.start()
+
+    def _fill(self, stream, chunk_size: int) -> None:
+        try:
+            with stream:
+                while True:
+                    chunk = stream.read(chunk_size)
+                    if not chunk:
+                        break
+                    self._chunks.put(chunk)
+        except Exception as exc:
+            self._error = exc
+        self._chunks.put(b"")
+
+    def readable(self) -> bool:
         return True
-    return False
+
+    def readinto(self, buffer) -> int:
+        if self._offset >= len(self._chunk):
+            if self._finished:
+                return 0
+            self._chunk = memoryview(self._chunks.get())
+            self._offset = 0
+            if not self._chunk:
+                self._finished = True
+                if self._error is not None:
+                    raise self._error
+                return 0
+
+        size = min(len(buffer), len(self._chunk) - self._offset)
+        buffer[:size] = self._chunk[self._offset:self._offset + size]
+        self._offset += size
+        return size
+
+
+def xml_rows(zf: zipfile.ZipFile, sheet_path: str, shared_strings: list[str]):
+    """Yield (contractor, invoice, print date) for each data row of the sheet XML."""
+    # Only the <c> cells in O/R/AA are decoded. Row 1 is the header row.
+    wanted = {
+        column_letter(COL_O): 0,
+        column_letter(COL_R): 1,
+        column_letter(COL_AA): 2,
+    }
+    header_pending = True
+
+    # The stdlib C parser is used on purpose: lxml has to build a Python
+    # proxy for every <c> element we walk, which made this loop slower.
+    with PrefetchReader(zf.open(sheet_path)) as stream:
+        for _, elem in ET.iterparse(stream, events=("end",)):
+            if elem.tag != ROW_TAG:
+                continue
+
+            if header_pending:
+                header_pending = False
+                if elem.get("r", "1") == "1":
+                    elem.clear()
+                    continue
+
+            # Cells are stored in column order, so O is seen before R and AA.
+            # Most rows are not Driver Pipeline; stop walking them at O.
+            values = [None, None, None]
+            for position, cell in enumerate(elem, start=1):
+                ref = cell.get("r")
+                column = ref.rstrip(DIGITS) if ref else column_letter(position)
+                slot = wanted.get(column)
+                if slot is None:
+                    continue
+                if slot and values[0] is None:
+                    break  # no contractor in column O
+                value = cell_value(cell, shared_strings)
+                if slot == 0 and not is_driver_pipeline(value):
+                    break
+                values[slot] = value
+            elem.clear()
+
+            yield values
+
+
+def calamine_rows(sheet):
+    """Yield (contractor, invoice, print date) for each data row of a python-calamine sheet."""
+    first_row, first_col = sheet.start
+    rows = sheet.iter_rows()
+    if first_row == 0:
+        next(rows, None)  # header row
+
+    # Rows are relative to the sheet's used range, which may not start at A.
+    slots = [col - 1 - first_col for col in (COL_O, COL_R, COL_AA)]
+    if all(0 <= slot < sheet.width for slot in slots):
+        o, r, aa = slots
+        for row in rows:
+            yield row[o], row[r], row[aa]
+    else:
+        for row in rows:
+            yield [row[slot] if 0 <= slot < len(row) else None for slot in slots]
+
+
+def open_workbook(file_path: str):
+    """
+    Open the workbook and return (sheet names, row reader).
+
+    The row reader takes a sheet name and returns an iterator of
+    (contractor, invoice, print date) values. python-calamine does the
+    parsing in Rust when it is installed; otherwise the sheet XML is
+    streamed with the stdlib parser.
+    """
+    with open(file_path, "rb") as handle:
+        if CalamineWorkbook is not None:
+            workbook = CalamineWorkbook.from_filelike(handle)
+
+            def read_rows(sheet_name: str):
+                return calamine_rows(workbook.get_sheet_by_name(sheet_name))
+
+            return workbook.sheet_names, read_rows
+
+    zf = zipfile.ZipFile(file_path)
+    sheets = sheet_paths(zf)
+    shared_strings = load_shared_strings(zf)
+
+    def read_rows(sheet_name: str):
+        return xml_rows(zf, sheets[sheet_name], shared_strings)
+
+    return list(sheets), read_rows
+
+
+_root: Tk | None = None
+
+
+def _get_root() -> Tk:
+    # One hidden root for every message; starting Tcl/Tk is the slow part.
+    global _root
+    if _root is None:
+        _root = Tk()
+        _root.withdraw()
+        _root.attributes("-topmost", True)
+    return _root
 
 
 def show_msg(text: str, title: str = "Paving Export Count") -> None:
-    root = Tk()
-    root.withdraw()
-    root.attributes("-topmost", True)
-    messagebox.showinfo(title, text)
-    root.destroy()
+    messagebox.showinfo(title, text, parent=_get_root())
 
 
 def main() -> int:
     file_path = r"Z:\Chandler Projects\Paving Repair\Limited Pavement Export (Power Query).xlsx"
     sheet_name = "Paving Export"
 
-    # 1-indexed column numbers: O=15, R=18, AA=27
-    COL_O = 15   # Contractor Assigned
-    COL_R = 18   # Invoice Number
-    COL_AA = 27  # Print Date
-
     PROGRESS_EVERY = 1000  # print every N rows scanned
 
     start_total = time.perf_counter()
     print(f"[INFO] Opening workbook: {file_path}")
 
     try:
-        wb = load_workbook(filename=file_path, data_only=True, read_only=True)
+        sheet_names, read_rows = open_workbook(file_path)
     except FileNotFoundError:
         show_msg(f"File not found:\n{file_path}", "Error")
         return 1
@@ -54,39 +291,34 @@ def main() -> int:
     open_elapsed = time.perf_counter() - start_total
     print(f"[INFO] Workbook opened in {open_elapsed:.2f}s")
 
-    if sheet_name not in wb.sheetnames:
+    if sheet_name not in sheet_names:
         show_msg(
             f"Sheet '{sheet_name}' was not found.\n\n"
-            f"Available sheets:\n- " + "\n- ".join(wb.sheetnames),
+            f"Available sheets:\n- " + "\n- ".join(sheet_names),
             "Error",
         )
         return 1
 
-    ws = wb[sheet_name]
-    max_row = ws.max_row
-    print(f"[INFO] Scanning sheet '{sheet_name}' rows: {max_row:,}")
+    print(f"[INFO] Scanning sheet '{sheet_name}'")
 
     count = 0
     scanned = 0
     start_scan = time.perf_counter()
+    rows = read_rows(sheet_name)
 
-    # Pull only columns A..AA so we can index O/R/AA by position.
-    # Start at row 2 to skip header row.
-    for row in ws.iter_rows(min_row=2, max_row=max_row, min_col=1, max_col=COL_AA, values_only=True):
+    for contractor_val, invoice_val, print_date_val in rows:
         scanned += 1
 
-        contractor_val = row[COL_O - 1]   # tuple is 0-indexed
-        invoice_val = row[COL_R - 1]
-        print_date_val = row[COL_AA - 1]
-
-        contractor_ok = (
-            isinstance(contractor_val, str)
-            and contractor_val.strip().lower() == "driver pipeline"
-        )
-        invoice_blank = is_blank(invoice_val)
-        print_date_present = not is_blank(print_date_val)
+        contractor_ok = is_driver_pipeline(contractor_val)
 
-        if contractor_ok and invoice_blank and print_date_present:
+        # Blank checks are inlined: this runs once per row, and None (an
+        # empty cell) is tested first since it is the common blank value.
+        if (
+            contractor_ok
+            and (invoice_val is None or (type(invoice_val) is str and not invoice_val.strip()))
+            and print_date_val is not None
+            and (type(print_date_val) is not str or print_date_val.strip() != "")
+        ):
             count += 1
 
         if scanned % PROGRESS_EVERY == 0:
@@ -94,7 +326,7 @@ def main() -> int:
             rate = scanned / elapsed if elapsed > 0 else 0
             # Note: scanned counts data rows (starting at Excel row 2)
             print(
-                f"[PROGRESS] scanned={scanned:,}/{(max_row-1):,} | "
+                f"[PROGRESS] scanned={scanned:,} | "
                 f"matches={count:,} | elapsed={elapsed:.1f}s | {rate:,.0f} rows/s"
             )
 
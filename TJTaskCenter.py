@@ -1,5 +1,8 @@
+import codecs
+import io
 import json
 import math
+import os
 import queue
 import re
 import subprocess
@@ -18,6 +21,15 @@ CONFIG_PATH = ROOT_DIR / "tasks.json"
 ASSETS_DIR = ROOT_DIR / "assets"
 LOGO_CANDIDATES = ("tj_logo.png", "tj_logo.gif", "tj_logo.ppm", "tj_logo.pgm")
 ICON_CANDIDATES = ("tj_icon.ico",)
+LOGO_PATHS = tuple(ASSETS_DIR / name for name in LOGO_CANDIDATES if (ASSETS_DIR / name).exists())
+OUTPUT_READ_SIZE = 65536
+CAMEL_CASE_SPLIT = re.compile(r"(?<!^)(?=[A-Z])")
+PY_SCRIPT_PATTERN = re.compile(r"([A-Za-z0-9_./\\ -]+\.py)")
+PLACEHOLDERS = {
+    "{python}": sys.executable,
+    "{project_dir}": str(ROOT_DIR),
+    "{assets_dir}": str(ASSETS_DIR),
+}
 
 
 BG_APP = "#0B1017"
@@ -40,16 +52,26 @@ class Task:
 
 
 def pretty_name(stem: str) -> str:
-    with_spaces = re.sub(r"(?<!^)(?=[A-Z])", " ", stem.replace("_", " ").strip())
+    with_spaces = CAMEL_CASE_SPLIT.sub(" ", stem.replace("_", " ").strip())
     return " ".join(word.capitalize() for word in with_spaces.split())
 
 
 def expand_placeholders(value: str) -> str:
-    return (
-        value.replace("{python}", sys.executable)
-        .replace("{project_dir}", str(ROOT_DIR))
-        .replace("{assets_dir}", str(ASSETS_DIR))
-    )
+    for placeholder, replacement in PLACEHOLDERS.items():
+        value = value.replace(placeholder, replacement)
+    return value
+
+
+def output_tag(text: str) -> str | None:
+    if "[ERROR]" in text:
+        return "error"
+    if "[DONE]" in text:
+        return "success"
+    if "[PROGRESS]" in text:
+        return "progress"
+    if "[INFO]" in text:
+        return "info"
+    return None
 
 
 def parse_task(raw: dict) -> Task | None:
@@ -98,22 +120,32 @@ def discover_tasks() -> list[Task]:
         except Exception:
             tasks = []
 
-    configured_scripts: set[str] = set()
-    for task in tasks:
-        script_name = find_script_name(task.command)
-        if script_name:
-            configured_scripts.add(script_name.lower())
-
-    for script in sorted(ROOT_DIR.glob("*.py")):
-        if script.name == Path(__file__).name:
-            continue
-        if script.name.lower() in configured_scripts:
-            continue
+    configured_scripts = frozenset(
+        script_name.lower()
+        for script_name in (find_script_name(task.command) for task in tasks)
+        if script_name
+    )
+
+    this_script = Path(__file__).name
+    with os.scandir(ROOT_DIR) as entries:
+        scripts = sorted(
+            (
+                entry.name
+                for entry in entries
+                if entry.name.lower().endswith(".py")
+                and entry.name != this_script
+                and entry.name.lower() not in configured_scripts
+                and entry.is_file()
+            ),
+            key=str.lower,
+        )
+
+    for script_name in scripts:
         tasks.append(
             Task(
-                name=pretty_name(script.stem),
-                description=f"Run {script.name}",
-                command=[sys.executable, script.name],
+                name=pretty_name(Path(script_name).stem),
+                description=f"Run {script_name}",
+                command=[sys.executable, script_name],
                 cwd=ROOT_DIR,
             )
         )
@@ -128,7 +160,7 @@ def find_script_name(command: list[str] | str) -> str | None:
                 return Path(part_clean).name
         return None
 
-    matches = re.findall(r"([A-Za-z0-9_./\\ -]+\.py)", command)
+    matches = PY_SCRIPT_PATTERN.findall(command)
     if matches:
         return Path(matches[-1].strip().strip("\"'")).name
     return None
@@ -144,7 +176,7 @@ class TaskCenter(Tk):
 
         self.tasks = tasks
         self.process: subprocess.Popen | None = None
-        self.output_queue: queue.Queue[str | tuple[str, int, str]] = queue.Queue()
+        self.output_queue: queue.Queue[str | list[str] | tuple[str, int, str]] = queue.Queue()
         self.logo_image: PhotoImage | None = None
         self.task_buttons: list[ttk.Button] = []
         self.style = ttk.Style(self)
@@ -275,17 +307,15 @@ class TaskCenter(Tk):
                     return
 
     def _load_logo(self) -> PhotoImage | None:
-        for logo_name in LOGO_CANDIDATES:
-            logo_path = ASSETS_DIR / logo_name
-            if logo_path.exists():
-                try:
-                    image = PhotoImage(file=str(logo_path))
-                    if image.width() > 360:
-                        scale = max(1, math.ceil(image.width() / 360))
-                        image = image.subsample(scale, scale)
-                    return image
-                except Exception:
-                    continue
+        for logo_path in LOGO_PATHS:
+            try:
+                image = PhotoImage(file=str(logo_path))
+                if image.width() > 360:
+                    scale = max(1, math.ceil(image.width() / 360))
+                    image = image.subsample(scale, scale)
+                return image
+            except Exception:
+                continue
         return None
 
     def _build_ui(self) -> None:
@@ -403,22 +433,25 @@ class TaskCenter(Tk):
             self._append_output("No tasks were found. Add scripts or update tasks.json.\n")
 
     def _append_output(self, text: str) -> None:
-        tag = None
-        stripped = text.strip()
-        if "[ERROR]" in stripped:
-            tag = "error"
-        elif "[DONE]" in stripped:
-            tag = "success"
-        elif "[PROGRESS]" in stripped:
-            tag = "progress"
-        elif "[INFO]" in stripped:
-            tag = "info"
+        self._write_output([text])
+
+    def _write_output(self, chunks: list[str]) -> None:
+        # Merge neighbouring chunks that share a tag so each run is a single
+        # Text insert, and only scroll once at the end.
+        runs: list[tuple[str | None, list[str]]] = []
+        for text in chunks:
+            tag = output_tag(text)
+            if runs and runs[-1][0] == tag:
+                runs[-1][1].append(text)
+            else:
+                runs.append((tag, [text]))
 
         self.output.configure(state="normal")
-        if tag:
-            self.output.insert("end", text, tag)
-        else:
-            self.output.insert("end", text)
+        for tag, parts in runs:
+            if tag:
+                self.output.insert("end", "".join(parts), tag)
+            else:
+                self.output.insert("end", "".join(parts))
         self.output.see("end")
         self.output.configure(state="disabled")
 
@@ -455,9 +488,7 @@ class TaskCenter(Tk):
                 shell=shell_mode,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
-                encoding="utf-8",
-                errors="replace",
+                bufsize=0,
             )
         except Exception as exc:
             self.output_queue.put(f"[ERROR] Failed to start task: {exc}\n")
@@ -465,8 +496,25 @@ class TaskCenter(Tk):
             return
 
         assert self.process.stdout is not None
-        for line in self.process.stdout:
-            self.output_queue.put(line)
+        # Read whatever the pipe has ready and queue it as one batch of lines,
+        # rather than one queue item per line. A trailing partial line is held
+        # back until its newline arrives.
+        decoder = io.IncrementalNewlineDecoder(
+            codecs.getincrementaldecoder("utf-8")(errors="replace"), translate=True
+        )
+        fd = self.process.stdout.fileno()
+        pending = ""
+        while True:
+            data = os.read(fd, OUTPUT_READ_SIZE)
+            text = pending + decoder.decode(data, final=not data)
+            if not data:
+                if text:
+                    self.output_queue.put([text])
+                break
+            lines = text.split("\n")
+            pending = lines.pop()
+            if lines:
+                self.output_queue.put([line + "\n" for line in lines])
 
         return_code = self.process.wait()
         self.output_queue.put(("__COMPLETE__", return_code, task.name))
@@ -481,20 +529,27 @@ class TaskCenter(Tk):
             self._append_output(f"[ERROR] Could not stop task: {exc}\n")
 
     def _drain_output_queue(self) -> None:
+        pending: list[str] = []
         while not self.output_queue.empty():
             item = self.output_queue.get()
             if isinstance(item, tuple) and item and item[0] == "__COMPLETE__":
                 _, return_code, task_name = item
                 if return_code == 0:
-                    self._append_output(f"\n[DONE] {task_name} completed successfully.\n")
+                    pending.append(f"\n[DONE] {task_name} completed successfully.\n")
                 else:
-                    self._append_output(f"\n[DONE] {task_name} exited with code {return_code}.\n")
+                    pending.append(f"\n[DONE] {task_name} exited with code {return_code}.\n")
                 self.process = None
                 self._set_running_state(False)
+            elif isinstance(item, list):
+                pending.extend(item)
             else:
-                self._append_output(str(item))
+                pending.append(str(item))
 
-        self.after(120, self._drain_output_queue)
+        if pending:
+            self._write_output(pending)
+
+        # Poll faster while a task is producing output, slower when idle.
+        self.after(50 if pending else 120, self._drain_output_queue)
 
 
 def main() -> int:
@@ -1,8 +1,15 @@
+import numpy as np
 import pandas as pd
 import tkinter as tk
 from tkinter import filedialog, messagebox
 import os
 
+try:
+    import python_calamine  # noqa: F401  (enables pandas' "calamine" engine)
+    EXCEL_ENGINE = "calamine"
+except ImportError:
+    EXCEL_ENGINE = None  # let pandas pick its default reader
+
 def style_html_table(html: str) -> str:
     """
     Take the raw HTML from pandas.DataFrame.to_html() and inject
@@ -53,15 +60,7 @@ def main():
 
     # -----------------------------
     # 3) Load the selected Excel file
-    # -----------------------------
-    try:
-        df = pd.read_excel(input_path)
-    except Exception as e:
-        messagebox.showerror("Error", f"Failed to read Excel file:\n{e}")
-        return
-
-    # -----------------------------
-    # 4) Check that required columns exist
+    #    Only the required columns are materialized.
     # -----------------------------
     required_cols = [
         "InvoiceNumber",
@@ -72,6 +71,19 @@ def main():
         "Address",
     ]
 
+    try:
+        df = pd.read_excel(
+            input_path,
+            engine=EXCEL_ENGINE,
+            usecols=lambda col: col in required_cols,
+        )
+    except Exception as e:
+        messagebox.showerror("Error", f"Failed to read Excel file:\n{e}")
+        return
+
+    # -----------------------------
+    # 4) Check that required columns exist
+    # -----------------------------
     missing_cols = [c for c in required_cols if c not in df.columns]
     if missing_cols:
         messagebox.showerror(
@@ -85,8 +97,8 @@ def main():
     #    - Remove rows where InvoiceNumber = "Cancelled"
     #    - Keep only rows where DateAssigned is blank
     # -----------------------------
-    df_filtered = df[df["InvoiceNumber"] != "Cancelled"].copy()
-    df_missing = df_filtered[df_filtered["DateAssigned"].isna()].copy()
+    keep = (df["InvoiceNumber"] != "Cancelled") & df["DateAssigned"].isna()
+    df_missing = df.loc[keep, required_cols].copy()
 
     # -----------------------------
     # 6) Add DaysMissing based on DateCut
@@ -126,17 +138,25 @@ def main():
     #     - MissingJobs: how many jobs missing DateAssigned
     #     - AvgDaysMissing: average age of missing jobs
     #     - OldestMissing: max age of missing jobs
-    # -----------------------------
-    summary = (
-        df_missing.groupby("CutAtmosSupervisor")
-        .agg(
-            MissingJobs=("PavementKey", "count"),
-            AvgDaysMissing=("DaysMissing", "mean"),
-            OldestMissing=("DaysMissing", "max"),
-        )
-        .reset_index()
-        .sort_values("MissingJobs", ascending=False)
-    )
+    #    Supervisors number in the dozens, so a single numpy pass over the
+    #    group codes is cheaper than building a pandas groupby.
+    #    factorize (like groupby) copes with mixed names and numeric IDs.
+    # -----------------------------
+    group, supervisors = pd.factorize(df_missing["CutAtmosSupervisor"], sort=True)
+    days = df_missing["DaysMissing"].to_numpy()
+    has_key = df_missing["PavementKey"].notna().to_numpy()
+
+    oldest = np.zeros(len(supervisors), dtype=days.dtype)
+    np.maximum.at(oldest, group, days)
+
+    summary = pd.DataFrame(
+        {
+            "CutAtmosSupervisor": supervisors,
+            "MissingJobs": np.bincount(group, weights=has_key).astype("int64"),
+            "AvgDaysMissing": np.bincount(group, weights=days) / np.bincount(group),
+            "OldestMissing": oldest,
+        }
+    ).sort_values("MissingJobs", ascending=False)
 
     # Optional: round AvgDaysMissing to 1 decimal
     summary["AvgDaysMissing"] = summary["AvgDaysMissing"].round(1)